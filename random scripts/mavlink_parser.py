@@ -4,6 +4,7 @@ MAVLink Custom Message Sender via Telemetry RF
 Base Station → Telemetry Radio → Pixhawk
 """
 
+import functools
 import struct
 import xml.etree.ElementTree as ET
 import random
@@ -13,11 +14,238 @@ import binascii
 import argparse
 from pathlib import Path
 
+# MAVLink base types to struct format characters
+_TYPE_TO_FMT = {
+    'uint8': 'B',
+    'int8': 'b',
+    'uint16': 'H',
+    'int16': 'h',
+    'uint32': 'I',
+    'int32': 'i',
+    'uint64': 'Q',
+    'int64': 'q',
+    'float': 'f',
+    'double': 'd',
+    'char': 's',
+}
+
+# Header after STX: len, incompat, compat, seq, sysid, compid, msgid LSB,
+# msgid middle/MSB, zero padding byte (10 bytes)
+_HEADER_STRUCT = struct.Struct('<BBBBBBBHx')
+_CRC_STRUCT = struct.Struct('<H')
+_PAYLOAD_OFFSET = 1 + _HEADER_STRUCT.size
+_MAX_PACKET_LEN = 280
+
+# time.sleep is only accurate to about this much; below it, yield instead
+_SLEEP_PRECISION_NS = 1_000_000
+# When packets are due faster than we can sleep, write several per serial write
+_WRITE_BATCH_PACKETS = 4
+_WRITE_BATCH_BYTES = 1024
+
+# Common MAVLink message CRC extras
+_STANDARD_CRC_EXTRAS = {
+    0: 50,    # HEARTBEAT
+    1: 124,   # SYS_STATUS
+    30: 39,   # ATTITUDE
+    33: 104,  # GLOBAL_POSITION_INT
+    74: 142,  # VFR_HUD
+    253: 83,  # STATUSTEXT
+    251: 170, # NAMED_VALUE_FLOAT
+}
+
+
+# Random test data ranges for fields without a name-specific generator
+_DEFAULT_RANGES = {
+    'uint8': (0, 255),
+    'int8': (-128, 127),
+    'uint16': (0, 65535),
+    'int16': (-32768, 32767),
+    'uint32': (0, 1000000),
+    'int32': (-1000000, 1000000),
+    'float': (0, 100),
+    'double': (0, 100),
+}
+
+
+def _crc_extra(message_id):
+    """Get the crc_extra for a message ID"""
+    # For custom messages (ID >= 50000), we need a crc_extra
+    # Use a simple derivation for custom messages
+    if message_id < 50000:
+        # Standard messages have predefined crc_extras
+        return _STANDARD_CRC_EXTRAS.get(message_id, 0)
+    # For custom messages, derive from message ID
+    return (message_id & 0xFF) ^ ((message_id >> 8) & 0xFF)
+
+
+def _initial_crc(crc_extra):
+    """CRC state after absorbing crc_extra, which MAVLink processes FIRST (important!)"""
+    # binascii.crc_hqx is the same CRC (poly 0x1021, MSB first) in C
+    return binascii.crc_hqx(bytes([crc_extra]), 0xFFFF)
+
+
+def _parse_field_type(field_type):
+    """Split a MAVLink field type into its base type and array length
+
+    'uint8_t' -> ('uint8', 1), 'char[10]' -> ('char', 10),
+    'uint8_t_mavlink_version' -> ('uint8', 1)
+    """
+    base, _, count = field_type.partition('[')
+    count = int(count.rstrip(']')) if count else 1
+    return base.split('_t', 1)[0], count
+
+
+def _parse_messages(xml_file):
+    """Stream message definitions out of a MAVLink XML file"""
+    messages = {}
+    for _, elem in ET.iterparse(xml_file, events=('end',)):
+        if elem.tag != 'message':
+            continue
+        
+        fields = tuple((field_elem.get('name'), field_elem.get('type'))
+                       for field_elem in elem.iterfind('field'))
+        msg_id = int(elem.get('id'))
+        messages[msg_id] = {
+            'name': elem.get('name'),
+            'fields': fields,
+            'crc_extra': _crc_extra(msg_id)
+        }
+        # Drop the parsed subtree, it is not needed anymore
+        elem.clear()
+    
+    return messages
+
+
+@functools.lru_cache(maxsize=8)
+def _load_messages(xml_file, mtime):
+    """Load message definitions, memoized on (path, mtime)
+
+    The returned table is shared between callers; load_xml hands out copies.
+    """
+    return _parse_messages(xml_file)
+
+
+def _make_sampler(field_name, field_type, rng):
+    """Return a callable producing random test data for a field, or None to leave it unset"""
+    base_type, _ = _parse_field_type(field_type)
+    name = field_name.lower()
+    # Bound once so the samplers avoid global and attribute lookups per call
+    randint = rng.randint
+    uniform = rng.uniform
+    now = time.time
+    
+    if 'timestamp' in name or 'time' in name:
+        if base_type == 'uint64':
+            return lambda: int(now() * 1000)
+        elif base_type == 'uint32':
+            return lambda: int(now())
+    
+    elif 'temperature' in name:
+        if base_type == 'float':
+            return lambda: uniform(20, 30)
+        else:
+            return lambda: randint(200, 300)
+    
+    elif 'pressure' in name:
+        if base_type == 'float':
+            return lambda: uniform(1000, 1020)
+        else:
+            return lambda: randint(100000, 102000)
+    
+    elif 'humidity' in name:
+        if base_type == 'float':
+            return lambda: uniform(40, 60)
+        else:
+            return lambda: randint(40, 60)
+    
+    else:
+        # Default values
+        if base_type in ('uint64', 'int64'):
+            return lambda: int(now() * 1000)
+        elif base_type == 'char':
+            return lambda: 'A'
+        elif base_type in _DEFAULT_RANGES:
+            low, high = _DEFAULT_RANGES[base_type]
+            if base_type in ('float', 'double'):
+                return lambda: uniform(low, high)
+            return lambda: randint(low, high)
+    
+    return None
+
+
+def _format_data(data):
+    """Format generated data for display, rounding floats only here"""
+    return ', '.join(f"{name}={value:.2f}" if isinstance(value, float) else f"{name}={value}"
+                     for name, value in data.items())
+
+
+def _array_sampler(sample, count):
+    """Wrap a per-element sampler to fill a whole array field"""
+    return lambda: [sample() for _ in range(count)]
+
+
+def _flatten_arrays(values, array_fields):
+    """Splice each array field's elements into the payload value list"""
+    flat = []
+    start = 0
+    for i, _ in array_fields:
+        flat.extend(values[start:i])
+        flat.extend(values[i])
+        start = i + 1
+    flat.extend(values[start:])
+    return flat
+
+def _compile_layout(fields):
+    """Work out the payload struct format and field order for a field list"""
+    format_str = '<'
+    field_names = []
+    char_indices = []
+    array_fields = []
+    for field_name, field_type in fields:
+        base_type, count = _parse_field_type(field_type)
+        fmt = _TYPE_TO_FMT.get(base_type)
+        if fmt is None:
+            continue
+        if base_type == 'char':
+            # char[N] is a fixed-length string, padded with NULs
+            char_indices.append(len(field_names))
+            fmt = f'{count}{fmt}'
+        elif count > 1:
+            # Numeric arrays take one value per element
+            array_fields.append((len(field_names), count))
+            fmt = f'{count}{fmt}'
+        format_str += fmt
+        field_names.append(field_name)
+    
+    return format_str, field_names, char_indices, array_fields
+
+
+def _fields_key(fields):
+    """Hashable snapshot of a message's field list, used as a cache key"""
+    key = tuple(fields)
+    try:
+        hash(key)
+    except TypeError:
+        # Fields given as lists rather than (name, type) tuples
+        key = tuple(map(tuple, fields))
+    return key
+
 class MAVLinkSender:
     def __init__(self, system_id=100, component_id=190):
         self.system_id = system_id
         self.component_id = component_id
         self.sequence = 0
+        # Private generator for the test data samplers
+        self._rng = random.Random()
+        # (message_id, fields, crc_extra) -> (payload Struct, field names,
+        #     char field indices, (array field index, length) pairs, initial CRC)
+        self._struct_cache = {}
+        # fields -> ([(field name, sampler)] for generate_data,
+        #            samplers in payload order for generate_values)
+        self._samplers = {}
+        # Packets are assembled in place in this buffer
+        self._buf = bytearray(_MAX_PACKET_LEN)
+        self._mv = memoryview(self._buf)
         
     def load_xml(self, xml_file):
         """Load message definitions from XML file"""
@@ -25,229 +253,159 @@ class MAVLinkSender:
             print(f"Error: XML file '{xml_file}' not found!")
             return {}
         
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-        
-        messages = {}
         print(f"Loading messages from: {xml_file}")
+        xml_path = Path(xml_file).resolve()
+        # Copy the memoized table so callers can't change what later loads see;
+        # the field lists are tuples and need no copy
+        messages = {msg_id: dict(msg_info) for msg_id, msg_info
+                    in _load_messages(str(xml_path), xml_path.stat().st_mtime).items()}
         
-        for msg_elem in root.findall('message'):
-            msg_id = int(msg_elem.get('id'))
-            msg_name = msg_elem.get('name')
-            
-            fields = []
-            for field_elem in msg_elem.findall('field'):
-                field_name = field_elem.get('name')
-                field_type = field_elem.get('type')
-                fields.append((field_name, field_type))
-            
-            messages[msg_id] = {
-                'name': msg_name,
-                'fields': fields
-            }
-            print(f"  ID {msg_id}: {msg_name} ({len(fields)} fields)")
+        for msg_id, msg_info in messages.items():
+            print(f"  ID {msg_id}: {msg_info['name']} ({len(msg_info['fields'])} fields)")
+        
+        # Work out how to fill each field once, not on every packet
+        for msg_id, msg_info in messages.items():
+            self.get_samplers(msg_info['fields'])
         
         return messages
     
-    def generate_data(self, fields):
-        """Generate random test data"""
-        data = {}
+    def get_samplers(self, fields):
+        """Get the test data samplers for a field list, building them on first use"""
+        key = _fields_key(fields)
+        samplers = self._samplers.get(key)
+        if samplers is None:
+            samplers = self._samplers[key] = self.build_samplers(fields)
+        return samplers
+    
+    def build_samplers(self, fields):
+        """Build (field name, sampler) pairs plus one sampler per payload field"""
+        named = []
         for field_name, field_type in fields:
-            if 'timestamp' in field_name.lower() or 'time' in field_name.lower():
-                if 'uint64' in field_type:
-                    data[field_name] = int(time.time() * 1000)
-                elif 'uint32' in field_type:
-                    data[field_name] = int(time.time())
-            
-            elif 'temperature' in field_name.lower():
-                if 'float' in field_type:
-                    data[field_name] = round(random.uniform(20, 30), 2)
-                else:
-                    data[field_name] = random.randint(200, 300)
-            
-            elif 'pressure' in field_name.lower():
-                if 'float' in field_type:
-                    data[field_name] = round(random.uniform(1000, 1020), 2)
-                else:
-                    data[field_name] = random.randint(100000, 102000)
-            
-            elif 'humidity' in field_name.lower():
-                if 'float' in field_type:
-                    data[field_name] = round(random.uniform(40, 60), 2)
-                else:
-                    data[field_name] = random.randint(40, 60)
-            
-            else:
-                # Default values
-                if 'uint8' in field_type:
-                    data[field_name] = random.randint(0, 255)
-                elif 'int8' in field_type:
-                    data[field_name] = random.randint(-128, 127)
-                elif 'uint16' in field_type:
-                    data[field_name] = random.randint(0, 65535)
-                elif 'int16' in field_type:
-                    data[field_name] = random.randint(-32768, 32767)
-                elif 'uint32' in field_type:
-                    data[field_name] = random.randint(0, 1000000)
-                elif 'int32' in field_type:
-                    data[field_name] = random.randint(-1000000, 1000000)
-                elif 'uint64' in field_type:
-                    data[field_name] = int(time.time() * 1000)
-                elif 'int64' in field_type:
-                    data[field_name] = int(time.time() * 1000)
-                elif 'float' in field_type:
-                    data[field_name] = round(random.uniform(0, 100), 4)
-                elif 'double' in field_type:
-                    data[field_name] = round(random.uniform(0, 100), 8)
-                elif 'char' in field_type:
-                    data[field_name] = 'A'
+            sample = _make_sampler(field_name, field_type, self._rng)
+            if sample is None:
+                continue
+            base_type, count = _parse_field_type(field_type)
+            if base_type != 'char' and count > 1:
+                sample = _array_sampler(sample, count)
+            named.append((field_name, sample))
         
-        return data
+        # Fields without a generator are sent as 0, like missing data
+        _, field_names, _, array_fields = _compile_layout(fields)
+        by_name = dict(named)
+        ordered = [by_name.get(name, lambda: 0) for name in field_names]
+        for i, count in array_fields:
+            if field_names[i] not in by_name:
+                ordered[i] = _array_sampler(ordered[i], count)
+        
+        return named, ordered
+    
+    def generate_data(self, fields):
+        """Generate random test data"""
+        return {name: sample() for name, sample in self.get_samplers(fields)[0]}
+    
+    def generate_values(self, message_id, msg_info):
+        """Generate random test data as payload values, ready for pack_values"""
+        return [sample() for sample in self.get_samplers(msg_info['fields'])[1]]
     
     def calculate_crc(self, data, crc_extra=0):
         """Calculate MAVLink CRC-16/MCRF4XX with proper crc_extra"""
-        crc = 0xFFFF
-        
-        # Process crc_extra FIRST (important!)
-        crc ^= (crc_extra << 8)
-        for _ in range(8):
-            if crc & 0x8000:
-                crc = (crc << 1) ^ 0x1021
-            else:
-                crc = crc << 1
-            crc &= 0xFFFF
-        
-        # Process data bytes
-        for byte in data:
-            crc ^= (byte << 8)
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ 0x1021
-                else:
-                    crc = crc << 1
-                crc &= 0xFFFF
+        return binascii.crc_hqx(data, _initial_crc(crc_extra))
+    
+    def get_packet_struct(self, message_id, msg_info):
+        """Get the compiled payload layout for a message, building it on first use"""
+        # Keyed on the definition too, so a different msg_info for the same ID
+        # never reuses a stale layout
+        crc_extra = msg_info.get('crc_extra', _crc_extra(message_id))
+        key = (message_id, _fields_key(msg_info['fields']), crc_extra)
+        cached = self._struct_cache.get(key)
+        if cached is not None:
+            return cached
         
-        return crc
+        format_str, field_names, char_indices, array_fields = \
+            _compile_layout(msg_info['fields'])
+        cached = (struct.Struct(format_str), field_names, char_indices, array_fields,
+                  _initial_crc(crc_extra))
+        self._struct_cache[key] = cached
+        return cached
     
     def create_mavlink_packet(self, message_id, msg_info, data):
         """Create a proper MAVLink 2 packet with correct CRC"""
-        fields = msg_info['fields']
+        _, field_names, _, array_fields, _ = self.get_packet_struct(message_id, msg_info)
+        values = [data.get(name, 0) for name in field_names]
+        for i, count in array_fields:
+            if field_names[i] not in data:
+                values[i] = [0] * count
         
-        # Pack payload
-        payload_bytes = b''
-        format_str = '<'
-        values = []
+        packet = self.pack_values(message_id, msg_info, values)
+        if packet is None:
+            return None
+        return bytes(packet)
+    
+    def pack_values(self, message_id, msg_info, values):
+        """Assemble a packet in the sender's buffer and return a view of it
+
+        values are the payload fields in packing order, with a sequence for
+        each array field. The view is only valid until the next packet is packed.
+        """
+        payload_struct, _, char_indices, array_fields, initial_crc = \
+            self.get_packet_struct(message_id, msg_info)
         
-        for field_name, field_type in fields:
-            value = data.get(field_name, 0)
-            
-            # Map MAVLink types to struct format characters
-            if 'uint8' in field_type:
-                format_str += 'B'
-                values.append(value)
-            elif 'int8' in field_type:
-                format_str += 'b'
-                values.append(value)
-            elif 'uint16' in field_type:
-                format_str += 'H'
-                values.append(value)
-            elif 'int16' in field_type:
-                format_str += 'h'
-                values.append(value)
-            elif 'uint32' in field_type:
-                format_str += 'I'
-                values.append(value)
-            elif 'int32' in field_type:
-                format_str += 'i'
-                values.append(value)
-            elif 'uint64' in field_type:
-                format_str += 'Q'
-                values.append(value)
-            elif 'int64' in field_type:
-                format_str += 'q'
-                values.append(value)
-            elif 'float' in field_type:
-                format_str += 'f'
-                values.append(value)
-            elif 'double' in field_type:
-                format_str += 'd'
-                values.append(value)
-            elif 'char' in field_type:
-                format_str += 'c'
-                values.append(bytes(str(value)[0], 'ascii'))
+        if char_indices:
+            values = list(values)
+            for i in char_indices:
+                values[i] = str(values[i]).encode('ascii')
         
-        if values:
-            try:
-                payload_bytes = struct.pack(format_str, *values)
-            except struct.error as e:
-                print(f"Error packing data: {e}")
-                return None
+        # Pack payload
+        try:
+            if array_fields:
+                values = _flatten_arrays(values, array_fields)
+            payload_struct.pack_into(self._buf, _PAYLOAD_OFFSET, *values)
+        except (struct.error, TypeError) as e:
+            print(f"Error packing data: {e}")
+            return None
         
         # MAVLink 2 header (10 bytes)
-        payload_len = len(payload_bytes)
+        payload_len = payload_struct.size
         incompat_flags = 0x00
         compat_flags = 0x00
         seq = self.sequence
         self.sequence = (self.sequence + 1) & 0xFF
         
-        # Build header (10 bytes total)
-        header = struct.pack('<BBBBBBB',
-                           payload_len,
-                           incompat_flags,
-                           compat_flags,
-                           seq,
-                           self.system_id,
-                           self.component_id,
-                           message_id & 0xFF)  # LSB of message ID
-        
-        header += struct.pack('<H', (message_id >> 8) & 0xFFFF)  # Middle and MSB
-        header += b'\x00'  # Padding byte
-        
-        # Calculate PROPER MAVLink CRC
-        # For custom messages (ID >= 50000), we need a crc_extra
-        # Use a simple derivation for custom messages
-        if message_id < 50000:
-            # Standard messages have predefined crc_extras
-            crc_extra = self.get_standard_crc_extra(message_id)
-        else:
-            # For custom messages, derive from message ID
-            crc_extra = (message_id & 0xFF) ^ ((message_id >> 8) & 0xFF)
-        
-        crc_data = header[1:] + payload_bytes  # Everything except STX
-        crc = self.calculate_crc(crc_data, crc_extra)
+        self._buf[0] = 0xFD
+        _HEADER_STRUCT.pack_into(self._buf, 1,
+                                 payload_len,
+                                 incompat_flags,
+                                 compat_flags,
+                                 seq,
+                                 self.system_id,
+                                 self.component_id,
+                                 message_id & 0xFF,  # LSB of message ID
+                                 (message_id >> 8) & 0xFFFF)  # Middle and MSB
         
-        # Build complete packet
-        packet = b'\xFD' + header + payload_bytes + struct.pack('<H', crc)
+        # Calculate PROPER MAVLink CRC (header after its length byte, then payload)
+        crc_end = _PAYLOAD_OFFSET + payload_len
+        crc = binascii.crc_hqx(self._mv[2:crc_end], initial_crc)
+        _CRC_STRUCT.pack_into(self._buf, crc_end, crc)
         
-        return packet
+        return self._mv[:crc_end + _CRC_STRUCT.size]
     
     def get_standard_crc_extra(self, message_id):
         """Get CRC extra for standard MAVLink messages"""
-        # Common MAVLink message CRC extras
-        crc_extras = {
-            0: 50,    # HEARTBEAT
-            1: 124,   # SYS_STATUS
-            30: 39,   # ATTITUDE
-            33: 104,  # GLOBAL_POSITION_INT
-            74: 142,  # VFR_HUD
-            253: 83,  # STATUSTEXT
-            251: 170, # NAMED_VALUE_FLOAT
-        }
-        return crc_extras.get(message_id, 0)
+        return _STANDARD_CRC_EXTRAS.get(message_id, 0)
     
     def send_packet(self, serial_port, packet, verbose=False):
         """Send packet via serial port"""
         try:
             serial_port.write(packet)
             if verbose:
-                hex_str = binascii.hexlify(packet).decode('ascii')
-                print(f"Sent: {hex_str}")
+                print(f"Sent: {packet.hex(' ')}")
             return True
         except Exception as e:
             print(f"Error sending packet: {e}")
             return False
     
-    def run(self, xml_file, serial_port, message_id=None, rate_hz=1, duration=60):
+    def run(self, xml_file, serial_port, message_id=None, rate_hz=1, duration=60,
+            verbose=False):
         """Main function: send MAVLink packets via telemetry"""
         
         # Load messages from XML
@@ -258,7 +416,7 @@ class MAVLinkSender:
         
         # If no specific message ID, use first one
         if message_id is None:
-            message_id = list(messages.keys())[0]
+            message_id = next(iter(messages))
         
         if message_id not in messages:
             print(f"Error: Message ID {message_id} not found in XML!")
@@ -276,39 +434,63 @@ class MAVLinkSender:
         print("="*60 + "\n")
         
         packet_count = 0
-        start_time = time.time()
-        interval = 1.0 / rate_hz
+        batch = bytearray()
+        batch_count = 0
+        start_ns = time.monotonic_ns()
+        end_ns = start_ns + int(duration * 1e9)
+        interval_ns = int(1e9 / rate_hz)
+        deadline = start_ns
         
         try:
-            while time.time() - start_time < duration:
-                # Generate test data
-                data = self.generate_data(msg_info['fields'])
+            while time.monotonic_ns() < end_ns:
+                # Generate test data, straight in payload order
+                values = self.generate_values(message_id, msg_info)
+                
+                # Create MAVLink packet (a view of the sender's buffer)
+                packet = self.pack_values(message_id, msg_info, values)
                 
-                # Create MAVLink packet
-                packet = self.create_mavlink_packet(message_id, msg_info, data)
+                if packet is not None:
+                    batch += packet
+                    batch_count += 1
                 
-                if packet:
-                    # Send packet
-                    if self.send_packet(serial_port, packet, verbose=False):
-                        packet_count += 1
+                deadline += interval_ns
+                remaining = deadline - time.monotonic_ns()
+                
+                # Send now unless the next packet is due too soon to sleep for
+                if batch_count and (remaining > _SLEEP_PRECISION_NS
+                                    or batch_count >= _WRITE_BATCH_PACKETS
+                                    or len(batch) >= _WRITE_BATCH_BYTES):
+                    if self.send_packet(serial_port, batch, verbose=verbose):
+                        previous_count = packet_count
+                        packet_count += batch_count
                         
                         # Display progress every 10 packets
-                        if packet_count % 10 == 0:
-                            elapsed = time.time() - start_time
+                        if packet_count // 10 != previous_count // 10:
+                            elapsed = (time.monotonic_ns() - start_ns) / 1e9
                             print(f"[{elapsed:.1f}s] Sent {packet_count} packets")
-                            print(f"  Last data: {data}")
+                            if verbose:
+                                field_names = self.get_packet_struct(message_id, msg_info)[1]
+                                print(f"  Last data: {_format_data(dict(zip(field_names, values)))}")
+                    batch.clear()
+                    batch_count = 0
+                    remaining = deadline - time.monotonic_ns()
                 
-                # Wait for next interval
-                next_time = start_time + (packet_count * interval)
-                sleep_time = next_time - time.time()
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                # Wait for next interval, yielding for the last stretch
+                while remaining > 0:
+                    if remaining > 2 * _SLEEP_PRECISION_NS:
+                        time.sleep((remaining - _SLEEP_PRECISION_NS) / 1e9)
+                    else:
+                        time.sleep(0)
+                    remaining = deadline - time.monotonic_ns()
+            
+            if batch_count and self.send_packet(serial_port, batch, verbose=verbose):
+                packet_count += batch_count
         
         except KeyboardInterrupt:
             print("\nStopped by user")
         
         finally:
-            elapsed = time.time() - start_time
+            elapsed = (time.monotonic_ns() - start_ns) / 1e9
             print(f"\n" + "="*60)
             print(f"Summary:")
             print(f"  Total packets sent: {packet_count}")
@@ -345,6 +527,8 @@ Common telemetry radio baud rates: 57600, 115200, 921600
                        help='System ID (default: 100)')
     parser.add_argument('--component', type=int, default=190,
                        help='Component ID (default: 190)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Print every packet sent and the generated data')
     
     args = parser.parse_args()
     
@@ -377,7 +561,8 @@ Common telemetry radio baud rates: 57600, 115200, 921600
     sender = MAVLinkSender(args.system, args.component)
     
     try:
-        sender.run(args.xml_file, ser, args.id, args.rate, args.duration)
+        sender.run(args.xml_file, ser, args.id, args.rate, args.duration,
+                   args.verbose)
     finally:
         ser.close()
         print(f"Closed serial port {args.port}")